@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from "next/server";
 import type { CalculationResult } from "@/types/mace";
+import { lastLine } from "@/lib/utils";
 
 const MACE_API_URL = (() => {
   const url = process.env.MACE_API_URL?.trim();
@@ -145,7 +146,7 @@ export async function POST(request: NextRequest) {
         }
 
         // Extract a human-readable message from stderr
-        const stderrTail = stderr.trim().split("\n").pop() ?? "";
+        const stderrTail = lastLine(stderr);
         const msg = stderrTail || stdout.trim().slice(0, 300) || "MACE calculation failed";
         throw new Error(msg);
       }
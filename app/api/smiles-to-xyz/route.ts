@@ -1,4 +1,5 @@
 import { NextRequest, NextResponse } from "next/server";
+import { lastLine } from "@/lib/utils";
 
 const MACE_API_URL = (() => {
   const url = process.env.MACE_API_URL?.trim();
@@ -102,7 +103,7 @@ export async function POST(request: NextRequest) {
         }
       }
 
-      const stderrTail = stderr.trim().split("\n").pop() ?? "";
+      const stderrTail = lastLine(stderr);
       throw new Error(
         stderrTail || stdout.trim().slice(0, 300) || "SMILES conversion failed"
       );
@@ -17,3 +17,12 @@ export function computeRmsForce(forces: number[][] | undefined): number | null {
   )
   return Math.sqrt(sumSq / forces.length)
 }
+
+/**
+ * Last non-empty line of a process's stderr/stdout, found without splitting
+ * the whole (possibly multi-MB) buffer into lines.
+ */
+export function lastLine(text: string): string {
+  const trimmed = text.trim()
+  return trimmed.slice(trimmed.lastIndexOf("\n") + 1)
+}
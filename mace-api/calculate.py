@@ -7,9 +7,31 @@ geometry optimization, molecular dynamics). Both the CLI wrapper
 """
 
 import time
+from functools import lru_cache
 from pathlib import Path
 
 
+def patch_torch_load():
+    """
+    PyTorch 2.6+ defaults torch.load to weights_only=True, but MACE checkpoints
+    contain custom model classes (ScaleShiftMACE etc.) that require full unpickling.
+    Restore the old default; must run before any MACE import. Idempotent.
+    """
+    import torch
+
+    if getattr(torch.load, "_mace_patched", False):
+        return
+    _original_torch_load = torch.load
+
+    def _patched_torch_load(*args, **kwargs):
+        if "weights_only" not in kwargs:
+            kwargs["weights_only"] = False
+        return _original_torch_load(*args, **kwargs)
+
+    _patched_torch_load._mace_patched = True
+    torch.load = _patched_torch_load
+
+
 def detect_format(filename: str) -> str:
     """Detect ASE file format from extension."""
     ext = Path(filename).suffix.lower()
@@ -24,6 +46,34 @@ def detect_format(filename: str) -> str:
     return "xyz"
 
 
+def _looks_like_extxyz(filepath: str) -> bool:
+    """True if the first frame's comment line carries extended-XYZ metadata."""
+    with open(filepath, errors="replace") as f:
+        f.readline()
+        comment = f.readline().replace(" ", "").lower()
+    return "properties=" in comment or "lattice=" in comment
+
+
+def read_structure(filepath: str):
+    """
+    Read the first frame of a structure file.
+
+    XYZ files are only handed to ASE's extxyz reader when the comment line
+    looks like extended XYZ: that reader stops after the requested frame, but
+    it parses free-text comments as key=value pairs and can fail or invent a
+    periodic cell. Plain XYZ (or extxyz that fails to parse) uses the xyz reader.
+    """
+    from ase.io import read
+
+    fmt = detect_format(filepath)
+    if fmt == "xyz" and _looks_like_extxyz(filepath):
+        try:
+            return read(filepath, index=0, format="extxyz")
+        except Exception:
+            pass  # malformed metadata — fall back to the plain reader
+    return read(filepath, index=0, format=fmt)
+
+
 def resolve_device(requested: str) -> str:
     """Resolve compute device, falling back to CPU if CUDA is unavailable."""
     if requested == "cuda":
@@ -37,9 +87,23 @@ def resolve_device(requested: str) -> str:
 
 
 def get_mace_calculator(model_type: str, model_size: str, device: str, dispersion: bool, precision: str = "float32"):
-    """Return ASE calculator for a MACE foundation model."""
-    model_size = model_size or "medium"
+    """
+    Return ASE calculator for a MACE foundation model.
+
+    The size is normalized before the cached load so an omitted size and
+    "medium" share one cache entry instead of loading the weights twice.
+    """
+    return _load_mace_calculator(model_type, model_size or "medium", device, dispersion, precision)
+
+
+@lru_cache(maxsize=4)
+def _load_mace_calculator(model_type: str, model_size: str, device: str, dispersion: bool, precision: str):
+    """
+    Load a foundation model calculator.
 
+    Cached per argument combination so the long-running FastAPI server loads
+    each model's weights once rather than on every request.
+    """
     if model_type in ("MACE-OFF", "MACE-OFF23"):
         from mace.calculators import mace_off
         return mace_off(model=model_size, device=device, default_dtype=precision)
@@ -48,8 +112,8 @@ def get_mace_calculator(model_type: str, model_size: str, device: str, dispersio
     return mace_mp(model=model_size, device=device, dispersion=dispersion, default_dtype=precision)
 
 
-def get_custom_calculator(model_path: str, device: str):
-    """Load a user-uploaded MACE model checkpoint."""
+def get_custom_calculator(model_path: str, device: str, precision: str = "float32"):
+    """Load a user-uploaded MACE model checkpoint in the requested precision."""
     from mace.calculators import MACECalculator
 
     if not Path(model_path).exists():
@@ -58,7 +122,7 @@ def get_custom_calculator(model_path: str, device: str):
     device = resolve_device(device)
 
     try:
-        return MACECalculator(model_paths=model_path, device=device)
+        return MACECalculator(model_paths=model_path, device=device, default_dtype=precision)
     except Exception as e:
         raise ValueError(
             f"Failed to load custom model '{Path(model_path).name}': {e}. "
@@ -67,7 +131,7 @@ def get_custom_calculator(model_path: str, device: str):
 
 
 def extract_reference_data(atoms) -> dict:
-    """Extract reference energy/forces from extended XYZ info/arrays."""
+    """Extract reference energy/forces from extended XYZ info/arrays or calc results."""
     ref = {}
 
     for key in ("REF_energy", "ref_energy", "energy", "dft_energy"):
@@ -86,13 +150,27 @@ def extract_reference_data(atoms) -> dict:
             except Exception:
                 pass
 
+    # extxyz moves plain energy=/forces into a SinglePointCalculator; read it
+    # before the MACE calculator replaces atoms.calc
+    calc_results = getattr(atoms.calc, "results", None) or {}
+    if "referenceEnergy" not in ref and "energy" in calc_results:
+        try:
+            ref["referenceEnergy"] = float(calc_results["energy"])
+        except (TypeError, ValueError):
+            pass
+    if "referenceForces" not in ref and "forces" in calc_results:
+        try:
+            ref["referenceForces"] = calc_results["forces"].tolist()
+        except Exception:
+            pass
+
     return ref
 
 
 def _build_result(atoms, energy, forces, msg, calc_start, ref_data,
                   trajectory=None):
     """Assemble the standard JSON result dict."""
-    symbols = [a.symbol for a in atoms]
+    symbols = atoms.get_chemical_symbols()
     lattice = atoms.get_cell().tolist() if atoms.pbc.any() else None
 
     result = {
@@ -124,10 +202,8 @@ def run_calculation(filepath: str, params: dict, model_path: str | None = None)
     Returns:
         Result dict with energy, forces, positions, trajectory, etc.
     """
-    from ase.io import read
-
-    fmt = detect_format(filepath)
-    atoms = read(filepath, format=fmt)
+    # Calculate the first frame — the one the frontend parser previews
+    atoms = read_structure(filepath)
     filename = Path(filepath).name
 
     ref_data = extract_reference_data(atoms)
@@ -140,7 +216,7 @@ def run_calculation(filepath: str, params: dict, model_path: str | None = None)
     precision = params.get("precision", "float32")
 
     if model_path:
-        calc = get_custom_calculator(model_path, device)
+        calc = get_custom_calculator(model_path, device, precision)
     else:
         calc = get_mace_calculator(model_type, model_size, device, dispersion, precision)
     atoms.calc = calc
@@ -18,22 +18,11 @@ import warnings
 warnings.filterwarnings("ignore")
 os.environ["PYTHONWARNINGS"] = "ignore"
 
-# PyTorch 2.6+ defaults torch.load to weights_only=True, but MACE checkpoints
-# contain custom model classes (ScaleShiftMACE etc.) that require full unpickling.
-# Patch torch.load before any MACE import to restore the old default.
-import torch
-_original_torch_load = torch.load
-def _patched_torch_load(*args, **kwargs):
-    if "weights_only" not in kwargs:
-        kwargs["weights_only"] = False
-    return _original_torch_load(*args, **kwargs)
-torch.load = _patched_torch_load
-
 # Redirect all non-JSON output (MACE/PyTorch info messages) to stderr
 import logging
 logging.disable(logging.CRITICAL)
 
-from calculate import run_calculation
+from calculate import patch_torch_load, run_calculation
 
 
 if __name__ == "__main__":
@@ -63,8 +52,11 @@ if __name__ == "__main__":
         sys.exit(1)
 
     try:
+        # Deferred past argument validation so usage errors skip the torch import
+        patch_torch_load()
         result = run_calculation(filepath, params, model_path=model_path)
-        print(json.dumps(result))
+        # Compact separators: MD/opt trajectories can make this payload several MB
+        print(json.dumps(result, separators=(",", ":")))
     except Exception as e:
         err_msg = str(e)
         if "CUDA" in err_msg or "cuda" in err_msg:
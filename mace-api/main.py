@@ -8,6 +8,7 @@ Deploy: uvicorn main:app --host 0.0.0.0 --port 7860
 import json
 import logging
 import os
+import shutil
 import sys
 import tempfile
 from pathlib import Path
@@ -23,27 +24,22 @@ _logger.info(
     [f for f in sorted(os.listdir(_app_dir)) if f.endswith(".py")],
 )
 
-# PyTorch 2.6+ defaults torch.load to weights_only=True, but MACE checkpoints
-# contain custom model classes (ScaleShiftMACE etc.) that require full unpickling.
-import torch
-_original_torch_load = torch.load
-def _patched_torch_load(*args, **kwargs):
-    if "weights_only" not in kwargs:
-        kwargs["weights_only"] = False
-    return _original_torch_load(*args, **kwargs)
-torch.load = _patched_torch_load
-
 from fastapi import FastAPI, File, Form, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 
-from calculate import run_calculation
+from calculate import patch_torch_load, run_calculation
 from pydantic import BaseModel
 
+# Restore torch.load(weights_only=False) for MACE checkpoints before any MACE import
+patch_torch_load()
+
 try:
     from smiles_to_xyz import smiles_to_xyz as _smiles_to_xyz
 except ImportError:
     _smiles_to_xyz = None
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
 app = FastAPI(
     title="MACE Calculation API",
     description="Run MACE energy and force calculations on atomic structures",
@@ -79,22 +75,21 @@ async def calculate(
         raise HTTPException(status_code=400, detail="No files provided")
 
     file = files[0]
-    content = await file.read()
 
+    # Stream uploads to disk in chunks rather than holding the whole body in memory
     with tempfile.NamedTemporaryFile(
         suffix=Path(file.filename or "struct").suffix, delete=False
     ) as tmp:
-        tmp.write(content)
+        shutil.copyfileobj(file.file, tmp, UPLOAD_CHUNK_SIZE)
         tmp_path = tmp.name
 
     # Handle custom model file if provided
     model_path = None
     if model is not None:
-        model_content = await model.read()
         with tempfile.NamedTemporaryFile(
             suffix=Path(model.filename or "model").suffix, delete=False
         ) as mtmp:
-            mtmp.write(model_content)
+            shutil.copyfileobj(model.file, mtmp, UPLOAD_CHUNK_SIZE)
             model_path = mtmp.name
 
     try:
@@ -107,10 +102,12 @@ async def calculate(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     finally:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
-        if model_path and os.path.exists(model_path):
-            os.unlink(model_path)
+        for path in (tmp_path, model_path):
+            if path:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
 
 
 class SmilesRequest(BaseModel):
@@ -16,6 +16,7 @@ or imported directly by the FastAPI server (main.py).
 
 import json
 import sys
+from functools import lru_cache
 
 MAX_ATOMS_DEFAULT = 500
 
@@ -27,13 +28,24 @@ def smiles_to_xyz(smiles: str, max_atoms: int = MAX_ATOMS_DEFAULT) -> dict:
     Returns dict with keys: xyz, num_atoms, smiles_canonical, formula.
     Raises ValueError on invalid input or conversion failure.
     """
-    from rdkit import Chem
-    from rdkit.Chem import AllChem, rdMolDescriptors
-
     if not smiles or not smiles.strip():
         raise ValueError("Empty SMILES string")
 
-    smiles = smiles.strip()
+    # Copy so callers can't mutate the cached entry
+    return dict(_convert(smiles.strip(), max_atoms))
+
+
+@lru_cache(maxsize=256)
+def _convert(smiles: str, max_atoms: int) -> dict:
+    """
+    Embed and optimize one SMILES string.
+
+    Memoized: embedding uses a fixed random seed, so the output is fully
+    determined by the inputs and the FastAPI server can skip repeat work.
+    Failures raise and are therefore never cached.
+    """
+    from rdkit import Chem
+    from rdkit.Chem import AllChem, rdMolDescriptors
 
     mol = Chem.MolFromSmiles(smiles)
     if mol is None:
@@ -6,7 +6,12 @@ Uses mock calculators (Morse potential) so no GPU or mace-torch needed.
 Run: cd mace-api && python3 test_geometry_opt.py
 """
 
+import os
+import sys
+import tempfile
+import types
 import unittest
+from unittest import mock
 import numpy as np
 from ase import Atoms, units
 from ase.calculators.morse import MorsePotential
@@ -145,6 +150,69 @@ class TestMaxwellBoltzmannInit(unittest.TestCase):
         self.assertGreater(ke, 0.0)
 
 
+class TestStructureReading(unittest.TestCase):
+    """Verify read_structure picks the right XYZ reader from the comment line."""
+
+    def _write_xyz(self, text):
+        fd, path = tempfile.mkstemp(suffix=".xyz")
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        self.addCleanup(os.unlink, path)
+        return path
+
+    def _water(self, comment):
+        return (
+            f"3\n{comment}\n"
+            "O 0.0 0.0 0.0\n"
+            "H 0.757 0.586 0.0\n"
+            "H -0.757 0.586 0.0\n"
+        )
+
+    def test_plain_xyz_free_text_comments(self):
+        from calculate import read_structure
+        for comment in ("Properties of water", "Lattice vectors omitted", "no pbc used"):
+            with self.subTest(comment=comment):
+                atoms = read_structure(self._write_xyz(self._water(comment)))
+                self.assertEqual(atoms.get_chemical_symbols(), ["O", "H", "H"])
+                self.assertFalse(atoms.pbc.any())
+
+    def test_extxyz_first_frame_and_reference_data(self):
+        from calculate import extract_reference_data, read_structure
+        frame = (
+            "3\n"
+            'Lattice="10 0 0 0 10 0 0 0 10" Properties=species:S:1:pos:R:3:forces:R:3 '
+            'energy={e} pbc="T T T"\n'
+            "O 0.0 0.0 0.0 0.1 0.0 0.0\n"
+            "H 0.757 0.586 0.0 -0.05 0.0 0.0\n"
+            "H -0.757 0.586 0.0 -0.05 0.0 0.0\n"
+        )
+        path = self._write_xyz(frame.format(e=-14.2) + frame.format(e=-99.0))
+        atoms = read_structure(path)
+        ref = extract_reference_data(atoms)
+        self.assertAlmostEqual(ref["referenceEnergy"], -14.2)
+        self.assertEqual(len(ref["referenceForces"]), 3)
+        self.assertAlmostEqual(ref["referenceForces"][0][0], 0.1)
+
+
+
+class TestFoundationModelCache(unittest.TestCase):
+    """Verify foundation model weights are loaded once per normalized config."""
+
+    def test_default_size_shares_cache_entry(self):
+        from calculate import _load_mace_calculator, get_mace_calculator
+        fake = types.ModuleType("mace.calculators")
+        fake.mace_mp = mock.MagicMock(return_value=object())
+        _load_mace_calculator.cache_clear()
+        self.addCleanup(_load_mace_calculator.cache_clear)
+        with mock.patch.dict(sys.modules, {"mace": types.ModuleType("mace"), "mace.calculators": fake}):
+            first = get_mace_calculator("MACE-MP-0", None, "cpu", False)
+            second = get_mace_calculator("MACE-MP-0", "medium", "cpu", False)
+        self.assertIs(first, second)
+        fake.mace_mp.assert_called_once_with(
+            model="medium", device="cpu", dispersion=False, default_dtype="float32"
+        )
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("MACE Calculate Engine — Unit Tests")
@@ -9,7 +9,7 @@ Run: python -m pytest test_smiles_to_xyz.py -v
 import math
 import unittest
 
-from smiles_to_xyz import smiles_to_xyz
+from smiles_to_xyz import _convert, smiles_to_xyz
 
 
 class TestValidSmiles(unittest.TestCase):
@@ -161,6 +161,16 @@ class TestEdgeCases(unittest.TestCase):
         result = smiles_to_xyz("c1ccncc1")  # pyridine
         self.assertEqual(result["num_atoms"], 11)  # C5H5N
 
+    def test_repeat_call_is_cached_copy(self):
+        _convert.cache_clear()
+        first = smiles_to_xyz("CCO")
+        hits_before = _convert.cache_info().hits
+        first["xyz"] = "mutated"
+        second = smiles_to_xyz(" CCO ")  # stripped before keying → cache hit
+        self.assertEqual(_convert.cache_info().hits, hits_before + 1)
+        self.assertNotEqual(second["xyz"], "mutated")
+        self.assertEqual(second["num_atoms"], 9)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -33,10 +33,46 @@ FORCE_MAX_REASONABLE = 50.0   # eV/Å (above this = likely overlapping atoms)
 FORCE_MAX_CRITICAL = 200.0    # eV/Å (almost certainly unphysical)
 MIN_INTERATOMIC_DIST = 0.4    # Å (below this = overlapping atoms)
 MAX_INTERATOMIC_DIST = 100.0  # Å (above this = disconnected structure)
+VALID_ELEMENTS = frozenset({
+    "H", "He", "Li", "Be", "B", "C", "N", "O", "F", "Ne",
+    "Na", "Mg", "Al", "Si", "P", "S", "Cl", "Ar", "K", "Ca",
+    "Sc", "Ti", "V", "Cr", "Mn", "Fe", "Co", "Ni", "Cu", "Zn",
+    "Ga", "Ge", "As", "Se", "Br", "Kr", "Rb", "Sr", "Y", "Zr",
+    "Nb", "Mo", "Tc", "Ru", "Rh", "Pd", "Ag", "Cd", "In", "Sn",
+    "Sb", "Te", "I", "Xe", "Cs", "Ba", "La", "Ce", "Pr", "Nd",
+    "Pm", "Sm", "Eu", "Gd", "Tb", "Dy", "Ho", "Er", "Tm", "Yb",
+    "Lu", "Hf", "Ta", "W", "Re", "Os", "Ir", "Pt", "Au", "Hg",
+    "Tl", "Pb", "Bi", "Po", "At", "Rn", "Fr", "Ra", "Ac", "Th",
+    "Pa", "U", "Np", "Pu", "Am",
+})
+MIN_DIST_CHECK_MAX_ATOMS = 2000  # atoms scanned by the pairwise distance check
+MIN_DIST_SCALAR_MAX_ATOMS = 64   # below this, math.dist beats NumPy's per-call overhead
+
+
+def _min_interatomic_distance(positions) -> float:
+    """Smallest pairwise distance (Å); large inputs are vectorized one row at a time."""
+    if len(positions) < MIN_DIST_SCALAR_MAX_ATOMS:
+        pts = [tuple(p) for p in positions]
+        return min(
+            math.dist(pts[i], pts[j])
+            for i in range(len(pts))
+            for j in range(i + 1, len(pts))
+        )
+
+    import numpy as np
+
+    pos = np.asarray(positions, dtype=np.float64)[:MIN_DIST_CHECK_MAX_ATOMS]
+    min_d2 = float("inf")
+    for i in range(len(pos) - 1):
+        diff = pos[i + 1:] - pos[i]
+        min_d2 = min(min_d2, float(np.einsum("ij,ij->i", diff, diff).min()))
+    return math.sqrt(min_d2)
 
 
 def validate_result(result: dict) -> dict:
     """Validate a MACE calculation result for scientific correctness."""
+    import numpy as np
+
     issues = []
     warnings_list = []
     info = []
@@ -84,18 +120,16 @@ def validate_result(result: dict) -> dict:
 
     # --- Force validation ---
     if forces is not None:
-        force_mags = []
-        for f in forces:
-            if len(f) == 3:
-                mag = math.sqrt(f[0]**2 + f[1]**2 + f[2]**2)
-                force_mags.append(mag)
-                if math.isnan(mag) or math.isinf(mag):
-                    issues.append("Force contains NaN or Inf values")
-                    break
-
-        if force_mags:
-            max_force = max(force_mags)
-            rms_force = math.sqrt(sum(f**2 for f in force_mags) / len(force_mags))
+        # Convert the per-atom list-of-lists once; all reductions below are NumPy kernels
+        f_arr = np.asarray([f for f in forces if len(f) == 3], dtype=np.float64).reshape(-1, 3)
+        force_mags = np.sqrt(np.einsum("ij,ij->i", f_arr, f_arr))
+        finite = bool(np.isfinite(force_mags).all())
+        if not finite:
+            issues.append("Force contains NaN or Inf values")
+
+        if finite and force_mags.size:
+            max_force = float(force_mags.max())
+            rms_force = math.sqrt(float(np.mean(force_mags**2)))
 
             if max_force > FORCE_MAX_CRITICAL:
                 issues.append(
@@ -112,10 +146,7 @@ def validate_result(result: dict) -> dict:
 
         # Check force sum (should be near zero for isolated systems)
         if forces and not lattice:
-            fx_sum = sum(f[0] for f in forces)
-            fy_sum = sum(f[1] for f in forces)
-            fz_sum = sum(f[2] for f in forces)
-            net_force = math.sqrt(fx_sum**2 + fy_sum**2 + fz_sum**2)
+            net_force = float(np.linalg.norm(f_arr.sum(axis=0)))
             if net_force > 0.1:
                 warnings_list.append(
                     f"Net force on isolated system = {net_force:.4f} eV/Å "
@@ -124,15 +155,7 @@ def validate_result(result: dict) -> dict:
 
     # --- Position validation ---
     if positions is not None and len(positions) > 1:
-        min_dist = float("inf")
-        n = len(positions)
-        for i in range(min(n, 200)):  # Cap for performance
-            for j in range(i + 1, min(n, 200)):
-                dx = positions[i][0] - positions[j][0]
-                dy = positions[i][1] - positions[j][1]
-                dz = positions[i][2] - positions[j][2]
-                d = math.sqrt(dx**2 + dy**2 + dz**2)
-                min_dist = min(min_dist, d)
+        min_dist = _min_interatomic_distance(positions)
 
         if min_dist < MIN_INTERATOMIC_DIST:
             warnings_list.append(
@@ -163,11 +186,12 @@ def validate_result(result: dict) -> dict:
     if trajectory is not None:
         energies = trajectory.get("energies", [])
         if energies:
-            if any(math.isnan(e) or math.isinf(e) for e in energies):
+            e_arr = np.fromiter(energies, dtype=np.float64, count=len(energies))
+            if not np.isfinite(e_arr).all():
                 issues.append("Trajectory contains NaN or Inf energies — MD diverged")
             else:
-                e_range = max(energies) - min(energies)
-                e_mean = sum(energies) / len(energies)
+                e_range = float(np.ptp(e_arr))
+                e_mean = float(e_arr.mean())
                 if abs(e_mean) > 0:
                     relative_fluct = e_range / abs(e_mean)
                     if relative_fluct > 0.5:
@@ -181,19 +205,7 @@ def validate_result(result: dict) -> dict:
 
     # --- Symbol validation ---
     if symbols:
-        valid_elements = {
-            "H", "He", "Li", "Be", "B", "C", "N", "O", "F", "Ne",
-            "Na", "Mg", "Al", "Si", "P", "S", "Cl", "Ar", "K", "Ca",
-            "Sc", "Ti", "V", "Cr", "Mn", "Fe", "Co", "Ni", "Cu", "Zn",
-            "Ga", "Ge", "As", "Se", "Br", "Kr", "Rb", "Sr", "Y", "Zr",
-            "Nb", "Mo", "Tc", "Ru", "Rh", "Pd", "Ag", "Cd", "In", "Sn",
-            "Sb", "Te", "I", "Xe", "Cs", "Ba", "La", "Ce", "Pr", "Nd",
-            "Pm", "Sm", "Eu", "Gd", "Tb", "Dy", "Ho", "Er", "Tm", "Yb",
-            "Lu", "Hf", "Ta", "W", "Re", "Os", "Ir", "Pt", "Au", "Hg",
-            "Tl", "Pb", "Bi", "Po", "At", "Rn", "Fr", "Ra", "Ac", "Th",
-            "Pa", "U", "Np", "Pu", "Am",
-        }
-        invalid = [s for s in symbols if s not in valid_elements]
+        invalid = [s for s in symbols if s not in VALID_ELEMENTS]
         if invalid:
             issues.append(f"Unknown element symbols: {invalid}")
 